@@ -1,5 +1,5 @@
 import dataclasses
-from typing import List, Optional, Sequence
+from typing import Optional, Sequence, Tuple, Union
 
 import numpy as np
 
@@ -36,41 +36,76 @@ class DampedLeastSquaresMapper(mapper.CartesianVelocitytoJointVelocityMapper):
 
     where @ denotes the matrix product, J is the end-effector Jacobian, λ is a damping
     factor and I is the identity matrix.
+
+    Note: The mapper holds scratch buffers for the Jacobian and the Hessian that are
+    overwritten by every call to `compute_joint_velocities`. It is therefore neither
+    reentrant nor thread-safe: concurrent callers must each use their own mapper. The
+    returned joint velocities are a new array and do not alias these buffers.
     """
 
     params: DampedLeastSquaresParameters
 
+    # Quantities that only depend on the model are computed once, along with scratch
+    # buffers reused across calls. Since the dataclass is frozen, they are set in
+    # `__post_init__` via `object.__setattr__`.
+    _object_ids: Tuple[int, ...] = dataclasses.field(
+        init=False, repr=False, compare=False
+    )
+    _regularizer: np.ndarray = dataclasses.field(init=False, repr=False, compare=False)
+    _jacobian_6d: np.ndarray = dataclasses.field(init=False, repr=False, compare=False)
+    _jacobian: np.ndarray = dataclasses.field(init=False, repr=False, compare=False)
+    _hessian: np.ndarray = dataclasses.field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        model = self.params.model
+        object_ids = tuple(
+            model.name2id(obj_name, obj_type)
+            for obj_type, obj_name in zip(
+                self.params.object_types, self.params.object_names
+            )
+        )
+        object.__setattr__(self, "_object_ids", object_ids)
+        object.__setattr__(
+            self, "_regularizer", np.eye(model.nv) * self.params.regularization_weight
+        )
+        object.__setattr__(self, "_jacobian_6d", np.empty((6, model.nv)))
+        object.__setattr__(self, "_jacobian", np.empty((3 * len(object_ids), model.nv)))
+        object.__setattr__(self, "_hessian", np.empty((model.nv, model.nv)))
+
     def compute_joint_velocities(
         self,
         data: hints.MjData,
-        target_velocities: Sequence[np.ndarray],
+        target_velocities: Union[np.ndarray, Sequence[np.ndarray]],
         nullspace_bias: Optional[np.ndarray] = None,
     ) -> np.ndarray:
         del nullspace_bias
 
-        # Compute and concatenate the Jacobian matrices for each end-effector.
-        jacobians: List[np.ndarray] = []
-        for obj_type, obj_name in zip(
-            self.params.object_types, self.params.object_names
+        # Compute and stack the Jacobian matrices for each end-effector.
+        jacobian = self._jacobian
+        for i, (obj_type, obj_id) in enumerate(
+            zip(self.params.object_types, self._object_ids)
         ):
-            jacobian = mujoco_utils.compute_object_6d_jacobian(
+            mujoco_utils.compute_object_6d_jacobian(
                 model=self.params.model,
                 data=data,
                 object_type=obj_type,
-                object_id=self.params.model.name2id(obj_name, obj_type),
+                object_id=obj_id,
+                out=self._jacobian_6d,
             )
-            jacobians.append(jacobian[:3])  # Ignore rotation component.
-        jacobian = np.concatenate(jacobians, axis=0)
+            # Ignore rotation component.
+            jacobian[3 * i : 3 * i + 3] = self._jacobian_6d[:3]
 
-        # Concatenate twists for each end-effector.
-        twist = np.concatenate(target_velocities, axis=0)
+        # Concatenate twists for each end-effector. An array holding one twist per row
+        # is flattened instead, which doesn't copy it if it's contiguous.
+        if isinstance(target_velocities, np.ndarray):
+            twist = target_velocities.reshape(-1)
+        else:
+            twist = np.concatenate(target_velocities, axis=0)
 
         # Solve!
         if self.params.regularization_weight > 0:
-            hess_approx = jacobian.T @ jacobian
-            hess_approx += (
-                np.eye(hess_approx.shape[0]) * self.params.regularization_weight
-            )
+            hess_approx = np.matmul(jacobian.T, jacobian, out=self._hessian)
+            hess_approx += self._regularizer
             return np.linalg.solve(hess_approx, jacobian.T @ twist)
         # Note: In the undamped case, the problem reduces to standard least-squares,
         # i.e., we are solving the following linear system of equations: `V = J @ v`.
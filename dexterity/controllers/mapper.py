@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import abc
 import dataclasses
-from typing import Optional, Sequence
+from typing import Optional, Sequence, Union
 
 import mujoco
 import numpy as np
@@ -34,10 +34,14 @@ class CartesianVelocitytoJointVelocityMapper(abc.ABC):
     def compute_joint_velocities(
         self,
         data: hints.MjData,
-        target_velocities: Sequence[np.ndarray],
+        target_velocities: Union[np.ndarray, Sequence[np.ndarray]],
         nullspace_bias: Optional[np.ndarray] = None,
     ) -> np.ndarray:
-        """Maps the Cartesian target velocity to joint velocities."""
+        """Maps the Cartesian target velocity to joint velocities.
+
+        `target_velocities` holds one target velocity per object. It can either be a
+        sequence of vectors or an array with one row per object.
+        """
 
 
 @dataclasses.dataclass(frozen=True)
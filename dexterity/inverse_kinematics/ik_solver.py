@@ -1,17 +1,15 @@
 # TODO(kevin): In the future, we'd like to solve for finger orientation as well.
 
-import copy
-from typing import List, NamedTuple, Optional, Sequence
+from typing import Dict, NamedTuple, Optional
 
 import mujoco
 import numpy as np
 from absl import logging
 from dm_control import mjcf
-from dm_robotics.geometry import geometry
-from dm_robotics.geometry import mujoco_physics
 
 from dexterity import controllers
 from dexterity.models.hands import dexterous_hand
+from dexterity.utils.geometry_utils import row_norms
 from dexterity.utils.mujoco_utils import get_element_type
 
 # Gain for the linear twist computation, should always be between 0 and 1.
@@ -35,38 +33,117 @@ class _Solution(NamedTuple):
     """Return value of an IK solution."""
 
     qpos: np.ndarray
-    linear_err: List[float]
+    linear_err: np.ndarray
 
 
 class IKSolver:
     """Inverse kinematics solver for a dexterous hand."""
 
-    def __init__(self, hand: dexterous_hand.DexterousHand) -> None:
-        # Note: We need the root model in case the hand is attached to another entity.
-        self._physics = mjcf.Physics.from_mjcf_model(hand.mjcf_model.root_model)
-        self._geometry_physics = mujoco_physics.wrap(self._physics)
+    def __init__(
+        self,
+        hand: dexterous_hand.DexterousHand,
+        seed: Optional[int] = None,
+        physics: Optional[mjcf.Physics] = None,
+    ) -> None:
+        """Initializes the solver.
+
+        Args:
+            hand: The hand to solve inverse kinematics for.
+            seed: Seed used to randomize the initial joint configuration of the IK
+                attempts. If None, fresh entropy is pulled from the OS.
+            physics: An optional `mjcf.Physics` instance compiled from a model that
+                contains the hand. If provided, the solver reuses its compiled model
+                instead of compiling the hand's MJCF model again. The solver works on
+                its own copy of the data, so `physics` is never modified.
+        """
+        self._rng = np.random.default_rng(seed)
+        self._regularization_weight = _REGULARIZATION_WEIGHT
+
+        if physics is None:
+            # Note: We need the root model in case the hand is attached to another
+            # entity.
+            physics = mjcf.Physics.from_mjcf_model(hand.mjcf_model.root_model)
+        else:
+            physics = physics.copy(share_model=True)
+        self._physics = physics
 
         # Get joint bindings.
         self._elements = hand.fingertip_sites
+        self._elements_binding = self._physics.bind(self._elements)
         self._all_joints_binding = self._physics.bind(hand.joints)
-        self._joint_bindings = []
-        for joint_group in hand.joint_groups:
-            joint_binding = self._physics.bind(joint_group.joints)
-            self._joint_bindings.append(joint_binding)
 
         # Make the midrange of the joints be the nullspace.
         self._nullspace_reference = np.mean(self._all_joints_binding.range, axis=1)
 
-        self._create_mapper()
-
-    def _create_mapper(self) -> None:
-        params = controllers.dls.DampedLeastSquaresParameters(
-            model=self._physics.model,
-            object_types=[get_element_type(element) for element in self._elements],
-            object_names=[element.full_identifier for element in self._elements],
-            regularization_weight=_REGULARIZATION_WEIGHT,
+        # Joint limits, used to sample random initial configurations and to clip the
+        # joint positions after each integration step.
+        self._qpos_min = self._all_joints_binding.range[:, 0].copy()
+        self._qpos_max = self._all_joints_binding.range[:, 1].copy()
+        self._qpos_span = self._qpos_max - self._qpos_min
+
+        # Going through the joints binding at every integration step is slow, so keep a
+        # view of the full `qpos` array along with the addresses of the hand's joints.
+        self._qpos = self._physics.data.qpos
+        joint_ids = [
+            self._physics.model.name2id(
+                joint.full_identifier, mujoco.mjtObj.mjOBJ_JOINT
+            )
+            for joint in hand.joints
+        ]
+        self._qpos_indices = self._physics.model.jnt_qposadr[joint_ids]
+
+        # Buffer holding the clipped joint positions after each integration step.
+        self._clipped_qpos = np.empty_like(self._nullspace_reference)
+
+        # Quaternions only need to be re-normalized for ball or free joints.
+        self._has_quaternion_joints = bool(
+            np.isin(
+                self._physics.model.jnt_type,
+                (mujoco.mjtJoint.mjJNT_BALL, mujoco.mjtJoint.mjJNT_FREE),
+            ).any()
         )
-        self._mapper = controllers.dls.DampedLeastSquaresMapper(params)
+
+        # Mappers are cached by regularization weight, since they only depend on it and
+        # on the model.
+        self._mappers: Dict[float, controllers.dls.DampedLeastSquaresMapper] = {}
+        self._mapper = self._get_mapper(self._regularization_weight)
+
+        # Buffer holding the Cartesian target velocity of each fingertip, reused across
+        # integration steps.
+        self._twists = np.empty((len(self._elements), 3))
+
+    def _get_mapper(
+        self, regularization_weight: float
+    ) -> controllers.dls.DampedLeastSquaresMapper:
+        """Returns the mapper for a regularization weight, creating it if needed."""
+        mapper = self._mappers.get(regularization_weight)
+        if mapper is None:
+            params = controllers.dls.DampedLeastSquaresParameters(
+                model=self._physics.model,
+                object_types=[get_element_type(element) for element in self._elements],
+                object_names=[element.full_identifier for element in self._elements],
+                regularization_weight=regularization_weight,
+            )
+            mapper = controllers.dls.DampedLeastSquaresMapper(params)
+            self._mappers[regularization_weight] = mapper
+        return mapper
+
+    @property
+    def regularization_weight(self) -> float:
+        """The damping factor used by the damped least-squares mapper."""
+        return self._regularization_weight
+
+    def set_regularization_weight(self, regularization_weight: float) -> None:
+        """Sets the damping factor used by the damped least-squares mapper.
+
+        Mappers are cached, so switching back to a previously used weight, e.g., when
+        retrying a failed solve with a different amount of damping, is cheap.
+
+        Raises:
+            ValueError: If `regularization_weight` is negative.
+        """
+        self._mapper = self._get_mapper(regularization_weight)
+        self._regularization_weight = regularization_weight
 
     def solve(
         self,
@@ -106,7 +183,11 @@ class IKSolver:
             Optional[np.ndarray]: Returns the corresponding joint configuration if a
             solution is found. If IK fails, it returns None.
         """
-        target_positions = target_positions.reshape(-1, 3)
+        # Convert the targets once to a contiguous float64 array, since they are read
+        # at every integration step of every attempt.
+        target_positions = np.ascontiguousarray(
+            target_positions, dtype=np.float64
+        ).reshape(-1, 3)
         if target_positions.shape[0] != len(self._elements):
             raise ValueError(
                 "The number of target positions must be equal to the number of "
@@ -125,8 +206,9 @@ class IKSolver:
             if attempt == 0:
                 self._all_joints_binding.qpos = self._nullspace_reference
             else:
-                self._all_joints_binding.qpos = np.random.uniform(
-                    *self._all_joints_binding.range.T
+                self._all_joints_binding.qpos = (
+                    self._qpos_min
+                    + self._qpos_span * self._rng.random(len(self._qpos_min))
                 )
 
             # Solve!
@@ -135,7 +217,7 @@ class IKSolver:
             )
 
             # Check that all fingers are within the desired tolerance.
-            if all(err <= linear_tol for err in linear_errors):
+            if np.all(linear_errors <= linear_tol):
                 success = True
                 nullspace_jnt_qpos_err = float(
                     np.linalg.norm(qpos - self._nullspace_reference)
@@ -159,66 +241,44 @@ class IKSolver:
         max_steps: int,
         early_stop: bool,
     ) -> _Solution:
-        cur_frames: List[geometry.PoseStamped] = []
-        cur_poses: List[geometry.Pose] = []
-        previous_poses: List[geometry.Pose] = []
-        for element in self._elements:
-            cur_frame = geometry.PoseStamped(pose=None, frame=element)
-            cur_pose = cur_frame.get_world_pose(self._geometry_physics)
-            cur_frames.append(cur_frame)
-            cur_poses.append(cur_pose)
-            previous_poses.append(copy.copy(cur_pose))
-
-        target_poses = [geometry.Pose(position=pos) for pos in target_positions]
+        # Fingertip positions at the previous integration step.
+        previous_positions = self._elements_binding.xpos.copy()
 
         # Each iteration of this loop attempts to reduce the error between the site's
         # position and the target position.
         for _ in range(max_steps):
-            twists = []
-            for cur_pose, target_pose in zip(cur_poses, target_poses):
-                twist = _compute_twist(
-                    cur_pose,
-                    target_pose,
-                    _LINEAR_VELOCITY_GAIN,
-                    _INTEGRATION_TIMESTEP_SEC,
-                )
-                twists.append(twist)
+            _compute_twist(
+                self._elements_binding.xpos,
+                target_positions,
+                _LINEAR_VELOCITY_GAIN,
+                _INTEGRATION_TIMESTEP_SEC,
+                out=self._twists,
+            )
 
-            qdot_sol = self._compute_joint_velocities(twists)
+            qdot_sol = self._compute_joint_velocities(self._twists)
 
             mujoco.mj_integratePos(
                 self._physics.model.ptr,
-                self._physics.data.qpos,
+                self._qpos,
                 qdot_sol,
                 _INTEGRATION_TIMESTEP_SEC,
             )
             self._update_physics_data()
 
-            linear_errors: List[float] = []
-            close_enough: bool = True
-            not_enough_progress: bool = False
+            # Get the distance between the current positions and the targets, and how
+            # much the positions changed during this step.
+            cur_positions = self._elements_binding.xpos
+            linear_errors = row_norms(target_positions - cur_positions)
+            linear_changes = row_norms(cur_positions - previous_positions)
+            previous_positions[:] = cur_positions
 
-            for i, target_position in enumerate(target_positions):
-                # Get the distance between the current pose and the target pose.
-                cur_pose = cur_frames[i].get_world_pose(self._geometry_physics)
-                linear_err = float(np.linalg.norm(target_position - cur_pose.position))
-                linear_errors.append(linear_err)
+            # Stop if all positions are close enough to their targets.
+            close_enough = bool(np.all(linear_errors <= linear_tol))
 
-                # Stop if the pose is close enough to the target pose.
-                if linear_err > linear_tol:
-                    close_enough = False
-
-                # Stop the solve if not enough progress is being made.
-                previous_pose = previous_poses[i]
-                linear_change = np.linalg.norm(
-                    cur_pose.position - previous_pose.position
-                )
-                if linear_err / (linear_change + 1e-10) > _PROGRESS_THRESHOLD:
-                    not_enough_progress = True
-
-                # Update the previous pose.
-                previous_poses[i] = copy.copy(cur_pose)
-                cur_poses[i] = cur_pose
+            # Stop the solve if not enough progress is being made.
+            not_enough_progress = bool(
+                np.any(linear_errors / (linear_changes + 1e-10) > _PROGRESS_THRESHOLD)
+            )
 
             # Break conditions.
             if (early_stop and close_enough) or not_enough_progress:
@@ -227,9 +287,7 @@ class IKSolver:
         qpos = np.array(self._all_joints_binding.qpos)
         return _Solution(qpos=qpos, linear_err=linear_errors)
 
-    def _compute_joint_velocities(
-        self, cartesian_6d_target: Sequence[np.ndarray]
-    ) -> np.ndarray:
+    def _compute_joint_velocities(self, cartesian_6d_target: np.ndarray) -> np.ndarray:
         """Maps a Cartesian 6D target velocity to joint velocities."""
         return self._mapper.compute_joint_velocities(
             data=self._physics.data,
@@ -240,22 +298,34 @@ class IKSolver:
     def _update_physics_data(self) -> None:
         """Updates the physics data following the integration of velocities."""
         # Clip joint positions.
-        qpos = self._all_joints_binding.qpos
-        qpos = np.clip(qpos, *self._all_joints_binding.range.T)
-        self._all_joints_binding.qpos[:] = qpos
+        np.clip(
+            self._qpos[self._qpos_indices],
+            self._qpos_min,
+            self._qpos_max,
+            out=self._clipped_qpos,
+        )
+        self._qpos[self._qpos_indices] = self._clipped_qpos
 
         # Forward kinematics to update the pose of the tracked site.
-        mujoco.mj_normalizeQuat(self._physics.model.ptr, self._physics.data.qpos)
+        if self._has_quaternion_joints:
+            mujoco.mj_normalizeQuat(self._physics.model.ptr, self._qpos)
         mujoco.mj_kinematics(self._physics.model.ptr, self._physics.data.ptr)
         mujoco.mj_comPos(self._physics.model.ptr, self._physics.data.ptr)
 
 
 def _compute_twist(
-    init_pose: geometry.Pose,
-    final_pose: geometry.Pose,
+    init_positions: np.ndarray,
+    final_positions: np.ndarray,
     linear_velocity_gain: float,
     control_timestep_seconds: float,
+    out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
-    """Returns the twist to apply to the element to reach final_pose from init_pose."""
-    position_error = final_pose.position - init_pose.position
-    return linear_velocity_gain * position_error / control_timestep_seconds
+    """Returns the linear twists to apply to the elements to reach final_positions from
+    init_positions.
+
+    Positions are given as (num_elements, 3) arrays and the twists are computed for all
+    elements at once. If `out` is provided, the result is written into it.
+    """
+    twists = np.subtract(final_positions, init_positions, out=out)
+    twists *= linear_velocity_gain / control_timestep_seconds
+    return twists
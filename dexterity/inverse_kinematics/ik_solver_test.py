@@ -1,5 +1,7 @@
 """Tests for ik_solver."""
 
+from unittest import mock
+
 import numpy as np
 from absl.testing import absltest
 from dm_control import mjcf
@@ -29,12 +31,81 @@ class IKSolverTest(absltest.TestCase):
         qpos_sol = solver.solve(target_positions)
         self.assertIsNone(qpos_sol)
 
+    def test_set_regularization_weight_reuses_mappers(self) -> None:
+        hand = hands.ShadowHandSeriesE()
+        solver = ik_solver.IKSolver(hand)
+        default_weight = solver.regularization_weight
+        default_mapper = solver._mapper
+
+        solver.set_regularization_weight(1e-3)
+        self.assertEqual(solver.regularization_weight, 1e-3)
+        self.assertEqual(solver._mapper.params.regularization_weight, 1e-3)
+
+        solver.set_regularization_weight(default_weight)
+        self.assertIs(solver._mapper, default_mapper)
+
+        with self.assertRaises(ValueError):
+            solver.set_regularization_weight(-1.0)
+        self.assertEqual(solver.regularization_weight, default_weight)
+
+    def test_reuses_physics_without_modifying_it(self) -> None:
+        random_state = np.random.RandomState(_SEED)
+
+        hand = hands.AdroitHand()
+        physics = mjcf.Physics.from_mjcf_model(hand.mjcf_model)
+        solver = ik_solver.IKSolver(hand, seed=_SEED, physics=physics)
+        self.assertIs(solver._physics.model.ptr, physics.model.ptr)
+
+        targets = _sample_reachable_targets(physics, hand, random_state)
+        qpos_before = physics.bind(hand.joints).qpos.copy()
+        qpos_sol = solver.solve(
+            targets,
+            linear_tol=_LINEAR_TOL,
+            early_stop=True,
+            stop_on_first_successful_attempt=True,
+        )
+        self.assertIsNotNone(qpos_sol)
+        np.testing.assert_array_equal(physics.bind(hand.joints).qpos, qpos_before)
+
+    def test_random_restarts_are_within_joint_limits_and_reproducible(self) -> None:
+        hand = hands.AdroitHand()
+        target_positions = np.full(shape=(5, 3), fill_value=10.0)
+
+        def _initial_qposes(seed: int) -> np.ndarray:
+            solver = ik_solver.IKSolver(hand, seed=seed)
+            initial_qposes = []
+            solve_ik = solver._solve_ik
+
+            def _record_initial_qpos(*args):
+                initial_qposes.append(solver._all_joints_binding.qpos.copy())
+                return solve_ik(*args)
+
+            with mock.patch.object(solver, "_solve_ik", _record_initial_qpos):
+                solver.solve(target_positions, max_steps=1, num_attempts=10)
+            return np.asarray(initial_qposes)
+
+        initial_qposes = _initial_qposes(_SEED)
+        self.assertLen(initial_qposes, 10)
+
+        # The first attempt starts from the midrange of the joints, the others from
+        # random configurations within the joint limits.
+        physics = mjcf.Physics.from_mjcf_model(hand.mjcf_model)
+        joint_range = physics.bind(hand.joints).range
+        np.testing.assert_allclose(initial_qposes[0], np.mean(joint_range, axis=1))
+        restarts = initial_qposes[1:]
+        self.assertTrue(np.all(restarts >= joint_range[:, 0]))
+        self.assertTrue(np.all(restarts <= joint_range[:, 1]))
+        self.assertEqual(len(np.unique(restarts, axis=0)), len(restarts))
+
+        # Restarts only depend on the seed.
+        np.testing.assert_array_equal(_initial_qposes(_SEED), initial_qposes)
+        self.assertFalse(np.array_equal(_initial_qposes(_SEED + 1), initial_qposes))
+
     def test_with_feasible_targets(self) -> None:
-        np.random.seed(_SEED)
         random_state = np.random.RandomState(_SEED)
 
         hand = hands.AdroitHand()  # Use a fully-actuated hand.
-        solver = ik_solver.IKSolver(hand)
+        solver = ik_solver.IKSolver(hand, seed=_SEED)
 
         for _ in range(_NUM_SOLVES):
             targets = _sample_reachable_targets(solver._physics, hand, random_state)
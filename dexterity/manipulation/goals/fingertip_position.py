@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Any, Optional
 
 import numpy as np
 from dm_control import mjcf
@@ -8,6 +8,7 @@ from dm_env import specs
 from dexterity import exception
 from dexterity import goal
 from dexterity.models.hands import dexterous_hand
+from dexterity.utils import geometry_utils
 from dexterity.utils import mujoco_collisions
 from dexterity.utils import mujoco_utils
 
@@ -36,6 +37,12 @@ class FingertipCartesianPosition(goal.GoalGenerator):
         self._reference_qpos: Optional[np.ndarray] = None
         self._goal_spec = None
 
+        # Binding of the fingertip sites, cached since the current state is queried at
+        # every step. It is refreshed at every episode and whenever a different physics
+        # instance is passed in.
+        self._bound_physics: Optional[mjcf.Physics] = None
+        self._fingertip_sites_binding: Any = None
+
     def goal_spec(self) -> specs.Array:
         if self._goal_spec is None:
             self._goal_spec = specs.Array(
@@ -55,8 +62,18 @@ class FingertipCartesianPosition(goal.GoalGenerator):
         # Apply gravity compensation.
         mujoco_utils.compensate_gravity(physics, self._hand.mjcf_model.find_all("body"))
 
+        self._bind_fingertip_sites(physics)
+
+    def _bind_fingertip_sites(self, physics: mjcf.Physics) -> None:
+        self._fingertip_sites_binding = physics.bind(self._hand.fingertip_sites)
+        self._bound_physics = physics
+
     def current_state(self, physics: mjcf.Physics) -> np.ndarray:
-        return np.array(physics.bind(self._hand.fingertip_sites).xpos).ravel()
+        if physics is not self._bound_physics:
+            self._bind_fingertip_sites(physics)
+        # Binding several elements already returns a fresh copy of their positions, so
+        # there is no need to copy it again.
+        return np.asarray(self._fingertip_sites_binding.xpos).reshape(-1)
 
     def next_goal(
         self, physics: mjcf.Physics, random_state: np.random.RandomState
@@ -127,7 +144,7 @@ class FingertipCartesianPosition(goal.GoalGenerator):
         self, goal_state: np.ndarray, current_state: np.ndarray
     ) -> np.ndarray:
         relative_goal = self.relative_goal(goal_state, current_state).reshape(-1, 3)
-        return np.linalg.norm(relative_goal, axis=1)
+        return geometry_utils.row_norms(relative_goal)
 
     @property
     def name(self) -> str:
@@ -56,9 +56,11 @@ def add_camera_observables(
     *camera_configs: CameraConfig,
 ) -> collections.OrderedDict:
     obs_dict = collections.OrderedDict()
+    # The same observable options are shared by all the cameras.
+    camera_options = dataclasses.asdict(obs_settings.camera)
     for config in camera_configs:
         camera = entity.mjcf_model.worldbody.add("camera", **dataclasses.asdict(config))
         obs = observable.MJCFCamera(camera)
-        obs.configure(**dataclasses.asdict(obs_settings.camera))
+        obs.configure(**camera_options)
         obs_dict[config.name] = obs
     return obs_dict
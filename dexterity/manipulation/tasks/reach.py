@@ -15,7 +15,6 @@ from dexterity.manipulation.goals import fingertip_position
 from dexterity.manipulation.props import TargetSphere
 from dexterity.manipulation.shared import cameras
 from dexterity.manipulation.shared import observations
-from dexterity.manipulation.shared import rewards
 from dexterity.manipulation.shared import tags
 from dexterity.models import arenas
 from dexterity.models.hands import adroit_hand
@@ -34,6 +33,8 @@ _SITE_COLORS = (
 )
 _TARGET_SIZE = 5e-3
 _TARGET_ALPHA = 1.0
+_SITE_RGBAS = tuple(color + (_SITE_ALPHA,) for color in _SITE_COLORS)
+_TARGET_RGBAS = tuple(color + (_TARGET_ALPHA,) for color in _SITE_COLORS)
 
 # Fraction of the full joint range to use when initializing the joints of the hand at
 # the start of every episode. Should be between 0 and 1.
@@ -46,8 +47,25 @@ _STEPS_BEFORE_MOVING_TARGET: int = 5
 # Note: OpenAI uses a threshold of 0.025.
 _DISTANCE_TO_TARGET_THRESHOLD = 0.01  # 1cm.
 
+# Distance to the target at which the dense reward penalty of a finger reaches 0.95,
+# in meters.
+_DENSE_REWARD_MARGIN = 0.1
+
+# Scale such that tanh(scale * margin)^2 = 0.95. See `rewards.tanh_squared`.
+_DENSE_REWARD_SCALE = np.arctanh(np.sqrt(0.95)) / _DENSE_REWARD_MARGIN
+
 # Assign this color to the finger geoms if the finger is within the target threshold.
 _THRESHOLD_COLOR = (0.0, 1.0, 0.0)  # Green.
+_THRESHOLD_RGBA = np.array(_THRESHOLD_COLOR + (1.0,))
+
+# (finger index, geom name) pairs for the geoms recolored when a finger reaches its
+# target. Shared by all `Reach` instances, each of which only looks the names up in its
+# own hand model.
+_FINGER_GEOMS = tuple(
+    (i, name)
+    for i, names in enumerate(consts.FINGER_GEOM_MAPPING.values())
+    for name in names
+)
 
 # Timestep of the physics simulation.
 # OpenAI uses a timestep of 0.002.
@@ -113,19 +131,35 @@ class Reach(task.GoalTask):
         for i, site in enumerate(hand.fingertip_sites):
             site.group = None  # Make the sites visible by default.
             site.size = (_SITE_SIZE,) * 3  # Increase their size.
-            site.rgba = _SITE_COLORS[i] + (_SITE_ALPHA,)  # Change their color.
+            site.rgba = _SITE_RGBAS[i]  # Change their color.
 
         # Create fingertip targets and attach them to the arena.
         self._targets = []
         for i, site in enumerate(hand.fingertip_sites):
             target = TargetSphere(
                 radius=_TARGET_SIZE,
-                rgba=_SITE_COLORS[i] + (_TARGET_ALPHA,),
+                rgba=_TARGET_RGBAS[i],
                 name=f"target_{site.name}",
             )
             arena.attach(target)
             self._targets.append(target)
 
+        # Look up the geoms of every finger, recolored when the finger reaches its
+        # target.
+        if visualize_reward:
+            self._finger_geoms = []
+            geom_to_finger = []
+            for i, name in _FINGER_GEOMS:
+                geom = hand.mjcf_model.find("geom", name)
+                if geom is not None:
+                    self._finger_geoms.append(geom)
+                    geom_to_finger.append(i)
+            # Index of the finger that each geom belongs to.
+            self._geom_to_finger = np.array(geom_to_finger)
+            # The geoms are sorted by MuJoCo id at the first episode, once the model is
+            # compiled.
+            self._finger_geoms_sorted = False
+
         # Disable collisions for the ground plane. It's only here for visualization
         # purposes.
         arena.ground.contype = 0
@@ -157,20 +191,26 @@ class Reach(task.GoalTask):
         )
         self.hand.set_joint_angles(physics, qpos)
 
-        positions = self._goal.reshape(5, 3)
-        for i, target in enumerate(self._targets):
-            physics.bind(target.site).pos = positions[i]
+        # Bind the target sites once per episode, so that moving them to a new goal is a
+        # single write.
+        self._target_sites_binding = physics.bind(
+            [target.site for target in self._targets]
+        )
+        self._target_sites_binding.pos = self._goal.reshape(-1, 3)
 
         # Save initial finger colors.
         if self._visualize_reward:
-            self._init_finger_colors = {}
-            for i, geoms in enumerate(consts.FINGER_GEOM_MAPPING.values()):
-                elems = [
-                    elem
-                    for elem in self.hand.mjcf_model.find_all("geom")
-                    if elem.name in geoms
-                ]
-                self._init_finger_colors[i] = (elems, physics.bind(elems).rgba)
+            # Order the geoms the way MuJoCo stores them, so that recoloring them writes
+            # to increasing addresses of the model's rgba buffer. The order only depends
+            # on the model, so it is computed once.
+            if not self._finger_geoms_sorted:
+                order = np.argsort(physics.bind(self._finger_geoms).element_id)
+                self._finger_geoms = [self._finger_geoms[i] for i in order]
+                self._geom_to_finger = self._geom_to_finger[order]
+                self._finger_geoms_sorted = True
+            self._finger_geoms_binding = physics.bind(self._finger_geoms)
+            self._init_finger_colors = np.array(self._finger_geoms_binding.rgba)
+            self._fingers_reached: Optional[np.ndarray] = None
 
     def before_step(
         self,
@@ -181,9 +221,7 @@ class Reach(task.GoalTask):
         super().before_step(physics, action, random_state)
 
         if self._goal_changed:
-            positions = self._goal.reshape(5, 3)
-            for i, target in enumerate(self._targets):
-                physics.bind(target.site).pos = positions[i]
+            self._target_sites_binding.pos = self._goal.reshape(-1, 3)
 
     def after_step(
         self, physics: mjcf.Physics, random_state: np.random.RandomState
@@ -195,29 +233,34 @@ class Reach(task.GoalTask):
 
     def get_reward(self, physics: mjcf.Physics) -> float:
         del physics  # Unused.
+        # The rewards below are averages over the fingers, spelled out as a sum divided
+        # by the number of fingers to skip `np.mean`'s overhead on such small arrays.
+        reached = self._goal_distance <= _DISTANCE_TO_TARGET_THRESHOLD
         if self._use_dense_reward:
-            # Dense reward.
-            return np.mean(
-                np.where(
-                    self._goal_distance <= _DISTANCE_TO_TARGET_THRESHOLD,
-                    0.0,
-                    [-rewards.tanh_squared(d, margin=0.1) for d in self._goal_distance],
-                )
-            )
-        # Sparse reward.
-        return np.mean(
-            np.where(self._goal_distance <= _DISTANCE_TO_TARGET_THRESHOLD, 0.0, -1.0)
-        )
+            # Dense reward. Equivalent to applying `rewards.tanh_squared` to every
+            # finger distance, evaluated in a single pass over the array.
+            penalty = np.square(np.tanh(_DENSE_REWARD_SCALE * self._goal_distance))
+            penalty[reached] = 0.0
+            return -penalty.sum() / penalty.size
+        # Sparse reward, minus the fraction of fingers not at their target.
+        return -np.count_nonzero(~reached) / reached.size
 
     # Helper methods.
 
     def _maybe_color_fingers(self, physics: mjcf.Physics) -> None:
-        for i, distance in enumerate(self._goal_distance):
-            elems, rgba = self._init_finger_colors[i]
-            if distance <= self._success_threshold:
-                physics.bind(elems).rgba = _THRESHOLD_COLOR + (1.0,)
-            else:
-                physics.bind(elems).rgba = rgba
+        del physics  # Unused.
+        reached = self._goal_distance <= self._success_threshold
+        # Only recolor the geoms when a finger entered or left its target threshold.
+        if self._fingers_reached is not None and np.array_equal(
+            reached, self._fingers_reached
+        ):
+            return
+        self._fingers_reached = reached
+        self._finger_geoms_binding.rgba = np.where(
+            reached[self._geom_to_finger, None],
+            _THRESHOLD_RGBA,
+            self._init_finger_colors,
+        )
 
 
 def reach_task(
@@ -5,6 +5,7 @@ from absl.testing import absltest
 
 from dexterity.environment import GoalEnvironment
 from dexterity.manipulation.shared import observations
+from dexterity.manipulation.shared import rewards
 from dexterity.manipulation.tasks import reach_task
 
 
@@ -34,6 +35,29 @@ class ReachTaskTest(absltest.TestCase):
         expected_reward = 0.0
         np.testing.assert_equal(timestep.reward, expected_reward)
 
+    def test_dense_reward(self) -> None:
+        task = reach_task(
+            observations.ObservationSet.STATE_ONLY,
+            use_dense_reward=True,
+            visualize_reward=False,
+        )
+
+        random_state = np.random.RandomState(12345)
+        env = GoalEnvironment(task, random_state=random_state)
+        action_spec = env.action_spec()
+
+        env.reset()
+        timestep = env.step(np.zeros(action_spec.shape, action_spec.dtype))
+
+        distance = env.task._goal_distance  # type: ignore
+        expected_reward = np.mean(
+            [
+                0.0 if d <= 0.01 else -rewards.tanh_squared(d, margin=0.1)
+                for d in distance
+            ]
+        )
+        np.testing.assert_allclose(timestep.reward, expected_reward)
+
 
 if __name__ == "__main__":
     absltest.main()
@@ -1,16 +1,16 @@
 import abc
 import dataclasses
 import enum
-from typing import Callable, List, Optional, Tuple
+from typing import Callable, Dict, List, Mapping, Optional, Sequence, Tuple
 
 import numpy as np
 from dm_control import composer
 from dm_control import mjcf
 from dm_control.composer.observation import observable
-from dm_robotics.transformations import transformations as tr
 
 from dexterity.hints import FloatArray
 from dexterity.hints import MjcfElement
+from dexterity.utils import geometry_utils
 from dexterity.utils import mujoco_collisions
 from dexterity.utils import mujoco_utils
 
@@ -37,6 +37,30 @@ class JointGrouping:
         return tuple([joint.name for joint in self.joints])
 
 
+def group_joints(
+    joints: Sequence[MjcfElement], groups: Mapping[str, Sequence[str]]
+) -> Tuple[JointGrouping, ...]:
+    """Splits joints into `JointGrouping`s given the joint names of each group.
+
+    Joints keep the order in which they appear in `joints`, and joints that do not
+    belong to any group are left out.
+    """
+    group_of_joint = {
+        joint_name: group_name
+        for group_name, joint_names in groups.items()
+        for joint_name in joint_names
+    }
+    grouped: Dict[str, List[MjcfElement]] = {group_name: [] for group_name in groups}
+    for joint in joints:
+        group_name = group_of_joint.get(joint.name)
+        if group_name is not None:
+            grouped[group_name].append(joint)
+    return tuple(
+        JointGrouping(name=group_name, joints=tuple(members))
+        for group_name, members in grouped.items()
+    )
+
+
 def _make_readonly_float64_copy(value: FloatArray) -> np.ndarray:
     out = np.array(value, dtype=np.float64)
     out.flags.writeable = False
@@ -270,7 +294,9 @@ class DexterousHandObservables(composer.Observables):
             # project them.
             torques = physics.bind(self._entity.joint_torque_sensors).sensordata
             joint_axes = physics.bind(self._entity.joints).axis
-            return np.einsum("ij,ij->i", torques.reshape(-1, 3), joint_axes)
+            # Note: A plain multiply-and-reduce is cheaper than `np.einsum` for arrays
+            # this small, since einsum has to parse its subscripts on every call.
+            return np.sum(torques.reshape(-1, 3) * joint_axes, axis=1)
 
         return observable.Generic(raw_observation_callable=_get_joint_torques)
 
@@ -288,22 +314,18 @@ class DexterousHandObservables(composer.Observables):
         """3D orientation of the fingertips relative to the world frame."""
 
         def _get_fingertip_orientations(physics: mjcf.Physics) -> np.ndarray:
-            xmats = physics.bind(self._entity.fingertip_sites).xmat.reshape(-1, 3, 3)
-            quats = [tr.mat_to_quat(xmat) for xmat in xmats]
-            return np.concatenate(quats)
+            xmats = physics.bind(self._entity.fingertip_sites).xmat
+            return geometry_utils.mats_to_quats(xmats).ravel()
 
         return observable.Generic(raw_observation_callable=_get_fingertip_orientations)
 
     @composer.observable
     def fingertip_linear_velocities(self) -> observable.Generic:
         def _get_fingertip_linear_velocities(physics: mjcf.Physics) -> np.ndarray:
-            linear_velocities = []
-            for fingertip_site in self._entity.fingertip_sites:
-                lin_vel = mujoco_utils.get_site_velocity(
-                    physics, fingertip_site, world_frame=True
-                )
-                linear_velocities.append(lin_vel[:3])
-            return np.concatenate(linear_velocities)
+            velocities = mujoco_utils.get_sites_velocities(
+                physics, self._entity.fingertip_sites, world_frame=True
+            )
+            return velocities[:, :3].ravel()
 
         return observable.Generic(
             raw_observation_callable=_get_fingertip_linear_velocities
@@ -312,13 +334,10 @@ class DexterousHandObservables(composer.Observables):
     @composer.observable
     def fingertip_angular_velocities(self) -> observable.Generic:
         def _get_fingertip_angular_velocities(physics: mjcf.Physics) -> np.ndarray:
-            angular_velocities = []
-            for fingertip_site in self._entity.fingertip_sites:
-                ang_vel = mujoco_utils.get_site_velocity(
-                    physics, fingertip_site, world_frame=True
-                )
-                angular_velocities.append(ang_vel[3:])
-            return np.concatenate(angular_velocities)
+            velocities = mujoco_utils.get_sites_velocities(
+                physics, self._entity.fingertip_sites, world_frame=True
+            )
+            return velocities[:, 3:].ravel()
 
         return observable.Generic(
             raw_observation_callable=_get_fingertip_angular_velocities
@@ -68,6 +68,18 @@ class HandTest(parameterized.TestCase):
         for joint in hand.joints:
             self.assertEqual(joint.tag, "joint")
 
+    def test_joint_groups(self, hand_cls: HandCls, constants) -> None:
+        hand = hand_cls()
+        self.assertEqual(
+            [group.name for group in hand.joint_groups], list(constants.JOINT_GROUP)
+        )
+        joint_order = {joint: i for i, joint in enumerate(hand.joints)}
+        for group in hand.joint_groups:
+            self.assertCountEqual(group.joint_names, constants.JOINT_GROUP[group.name])
+            # Joints within a group should follow the order of the hand's joints.
+            indices = [joint_order[joint] for joint in group.joints]
+            self.assertEqual(indices, sorted(indices))
+
     def test_actuators(self, hand_cls: HandCls, constants) -> None:
         hand = hand_cls()
         self.assertLen(hand.actuators, constants.NUM_ACTUATORS)
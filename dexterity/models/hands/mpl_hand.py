@@ -141,14 +141,9 @@ class MPLHand(dexterous_hand.DexterousHand):
         self._fingertip_sites = tuple(fingertip_sites)
 
         # Create joint groups.
-        joint_groups = []
-        for name, group in consts.JOINT_GROUP.items():
-            joint_group = dexterous_hand.JointGrouping(
-                name=name,
-                joints=tuple([joint for joint in self._joints if joint.name in group]),
-            )
-            joint_groups.append(joint_group)
-        self._joint_groups = tuple(joint_groups)
+        self._joint_groups = dexterous_hand.group_joints(
+            self._joints, consts.JOINT_GROUP
+        )
 
     def _add_sensors(self) -> None:
         """Add sensors to the hand's MJCF model."""
@@ -139,14 +139,9 @@ class ShadowHandSeriesE(dexterous_hand.DexterousHand):
         self._tendons = mjcf_utils.safe_find_all(self.mjcf_model, "tendon")
 
         # Create joint groups.
-        joint_groups = []
-        for name, group in consts.JOINT_GROUP.items():
-            joint_group = dexterous_hand.JointGrouping(
-                name=name,
-                joints=tuple([joint for joint in self._joints if joint.name in group]),
-            )
-            joint_groups.append(joint_group)
-        self._joint_groups = tuple(joint_groups)
+        self._joint_groups = dexterous_hand.group_joints(
+            self._joints, consts.JOINT_GROUP
+        )
 
     def _add_fingertip_sites(self) -> None:
         """Adds sites to the tips of the fingers of the hand."""
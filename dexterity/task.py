@@ -133,6 +133,7 @@ class GoalTask(Task):
 
         # Initialize with dummy goal to appease `task_observables`.
         self._goal = self._goal_generator.goal_spec().generate_value()
+        self._goal_observation: Optional[np.ndarray] = None
 
     def initialize_episode(
         self, physics: mjcf.Physics, random_state: np.random.RandomState
@@ -143,10 +144,11 @@ class GoalTask(Task):
 
         # Generate the first goal.
         self._goal = self._goal_generator.next_goal(physics, random_state)
+        self._goal_observation = None
 
         self._successes = 0
         self._success_change_counter = 0
-        self._solve_start_time = physics.data.time
+        self._goal_deadline = self._get_goal_deadline(physics)
         self._exceeded_single_goal_time = False
         self._success_registered = False
         self._goal_changed = True
@@ -156,9 +158,10 @@ class GoalTask(Task):
 
         if self._success_change_counter > self._steps_before_changing_goal:
             self._goal = self._goal_generator.next_goal(physics, random_state)
+            self._goal_observation = None
             self._success_change_counter = 0
             self._exceeded_single_goal_time = False
-            self._solve_start_time = physics.data.time
+            self._goal_deadline = self._get_goal_deadline(physics)
             self._goal_changed = True
             self._success_registered = False
         else:
@@ -179,18 +182,16 @@ class GoalTask(Task):
             if not self._success_registered:
                 self._successes += 1
                 self._success_registered = True
-        else:
-            if self._max_time_per_goal is not None:
-                if physics.data.time - self._solve_start_time > self._max_time_per_goal:
-                    self._exceeded_single_goal_time = True
+        elif physics.data.time > self._goal_deadline:
+            self._exceeded_single_goal_time = True
 
     def should_terminate_episode(self, physics: mjcf.Physics) -> bool:
         del physics  # Unused.
-        if self._successes >= self._successes_needed or (
-            self._max_time_per_goal is not None and self._exceeded_single_goal_time
-        ):
-            return True
-        return False
+        # `_exceeded_single_goal_time` is never set when `_max_time_per_goal` is None,
+        # since the goal deadline is then infinite.
+        return (
+            self._successes >= self._successes_needed or self._exceeded_single_goal_time
+        )
 
     def get_discount(self, physics: mjcf.Physics) -> float:
         # In the finite-horizon setting, on successful termination, we return 0.0 to
@@ -209,12 +210,30 @@ class GoalTask(Task):
 
         # Add the goal at the current timestep to the task observables.
         goal_spec = self._goal_generator.goal_spec()
-        goal_observable = goal.GoalObservable(lambda _: np.array(self._goal), goal_spec)
+        goal_observable = goal.GoalObservable(self._get_goal_observation, goal_spec)
         goal_observable.enabled = True
         task_observables["goal_state"] = goal_observable
 
         return task_observables
 
+    def _get_goal_deadline(self, physics: mjcf.Physics) -> float:
+        """Returns the simulation time by which the current goal must be solved."""
+        if self._max_time_per_goal is None:
+            return float("inf")
+        return physics.data.time + self._max_time_per_goal
+
+    def _get_goal_observation(self, physics: mjcf.Physics) -> np.ndarray:
+        """Returns a read-only copy of the current goal.
+
+        The goal only changes at the start of an episode or in `before_step`, so the
+        copy is made once per goal rather than every time the observable is read.
+        """
+        del physics  # Unused.
+        if self._goal_observation is None:
+            self._goal_observation = np.array(self._goal)
+            self._goal_observation.flags.writeable = False
+        return self._goal_observation
+
     @property
     def goal_generator(self) -> goal.GoalGenerator:
         return self._goal_generator
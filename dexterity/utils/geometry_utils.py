@@ -12,3 +12,51 @@ def l2_normalize(
     square_sum = np.sum(np.square(x), axis=axis, keepdims=True)  # type: ignore
     x_inv_norm = 1.0 / np.sqrt(np.maximum(square_sum, epsilon))
     return x * x_inv_norm
+
+
+def row_norms(x: np.ndarray) -> np.ndarray:
+    """Returns the Euclidean norm of each row of a 2D array.
+
+    For the handful of 3-vectors we deal with, this is cheaper than `np.linalg.norm`,
+    which spends most of its time dispatching on its arguments.
+    """
+    return np.sqrt(np.sum(x * x, axis=1))
+
+
+def mats_to_quats(mats: np.ndarray) -> np.ndarray:
+    """Converts a stack of rotation matrices to quaternions.
+
+    This is a vectorized version of `transformations.mat_to_quat` and returns the same
+    [w, i, j, k] quaternions, including their sign.
+
+    Args:
+        mats: An array of shape (N, 3, 3) or (N, 9) holding N rotation matrices.
+
+    Returns:
+        An array of shape (N, 4).
+    """
+    m = np.asarray(mats, dtype=np.float64).reshape(-1, 3, 3)
+    m00, m01, m02 = m[:, 0, 0], m[:, 0, 1], m[:, 0, 2]
+    m10, m11, m12 = m[:, 1, 0], m[:, 1, 1], m[:, 1, 2]
+    m20, m21, m22 = m[:, 2, 0], m[:, 2, 1], m[:, 2, 2]
+
+    # Each row holds the unnormalized quaternion obtained by pivoting on w, i, j and k
+    # respectively. The k-th row's k-th entry is the term we normalize by.
+    candidates = np.stack(
+        [
+            np.stack([1.0 + m00 + m11 + m22, m21 - m12, m02 - m20, m10 - m01], -1),
+            np.stack([m21 - m12, 1.0 + m00 - m11 - m22, m01 + m10, m02 + m20], -1),
+            np.stack([m02 - m20, m01 + m10, 1.0 - m00 + m11 - m22, m12 + m21], -1),
+            np.stack([m10 - m01, m02 + m20, m12 + m21, 1.0 - m00 - m11 + m22], -1),
+        ],
+        axis=1,
+    )
+
+    # Pivot on w when the trace is positive, otherwise on the largest diagonal entry.
+    trace = m00 + m11 + m22
+    diagonal = np.stack([m00, m11, m22], axis=-1)
+    pivot = np.where(trace > 0.0, 0, 1 + np.argmax(diagonal, axis=-1))
+
+    rows = np.arange(m.shape[0])
+    quats = candidates[rows, pivot]
+    return quats * (0.5 / np.sqrt(quats[rows, pivot]))[:, None]
@@ -2,6 +2,7 @@
 
 import numpy as np
 from absl.testing import absltest
+from dm_robotics.transformations import transformations as tr
 
 from dexterity.utils import geometry_utils
 
@@ -12,6 +13,25 @@ class GeometryUtilsTest(absltest.TestCase):
         output_array = geometry_utils.l2_normalize(input_array)
         self.assertTrue(np.isclose(np.linalg.norm(output_array), 1.0))
 
+    def test_row_norms(self) -> None:
+        x = np.random.randn(5, 3)
+        np.testing.assert_allclose(
+            geometry_utils.row_norms(x), np.linalg.norm(x, axis=1)
+        )
+
+    def test_mats_to_quats_matches_mat_to_quat(self) -> None:
+        random_state = np.random.RandomState(12345)
+        quats = geometry_utils.l2_normalize(random_state.randn(100, 4), axis=-1)
+        mats = np.stack([tr.quat_to_mat(quat)[:3, :3] for quat in quats])
+
+        actual = geometry_utils.mats_to_quats(mats)
+        expected = np.stack([tr.mat_to_quat(mat) for mat in mats])
+        np.testing.assert_allclose(actual, expected, atol=1e-12)
+
+        # Flattened matrices, as stored by MuJoCo, should also be supported.
+        actual = geometry_utils.mats_to_quats(mats.reshape(-1, 9))
+        np.testing.assert_allclose(actual, expected, atol=1e-12)
+
 
 if __name__ == "__main__":
     absltest.main()
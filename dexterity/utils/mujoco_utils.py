@@ -1,4 +1,4 @@
-from typing import Sequence
+from typing import Optional, Sequence
 
 import mujoco
 import numpy as np
@@ -35,11 +35,43 @@ def get_site_velocity(
     return np.hstack([site_vel[3:], site_vel[:3]])
 
 
+def get_sites_velocities(
+    physics: mjcf.Physics,
+    site_elems: Sequence[mjcf.Element],
+    world_frame: bool = False,
+) -> np.ndarray:
+    """Returns the linear and angular velocities of multiple sites.
+
+    This is the batched version of `get_site_velocity`: the velocities are written into
+    a single (N, 6) array, one row per site, with the linear velocity first.
+
+    Args:
+        physics: An `mjcf.Physics` instance.
+        site_elems: A sequence of `mjcf.Element` site instances.
+        world_frame: Whether to return the velocities in the world frame.
+    """
+    flg_local = 0 if world_frame else 1
+    site_vels = np.empty((len(site_elems), 6))
+    for site_vel, site_elem in zip(site_vels, site_elems):
+        idx = physics.model.name2id(site_elem.full_identifier, mujoco.mjtObj.mjOBJ_SITE)
+        mujoco.mj_objectVelocity(
+            physics.model.ptr,
+            physics.data.ptr,
+            mujoco.mjtObj.mjOBJ_SITE,
+            idx,
+            site_vel,
+            flg_local,
+        )
+    # MuJoCo returns the rotational component first.
+    return np.roll(site_vels, 3, axis=1)
+
+
 def compute_object_6d_jacobian(
     model: hints.MjModel,
     data: hints.MjData,
     object_type: hints.MujocoObjectType,
     object_id: int,
+    out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
     """Computes the (6, nv) object Jacobian.
 
@@ -48,8 +80,14 @@ def compute_object_6d_jacobian(
     coordinate of the specified point with respect to the degrees of freedom.
 
     Only MuJoCo bodies, geoms and sites are supported.
+
+    If `out` is provided, it must be a C-contiguous (6, nv) array. The Jacobian is
+    written into it in place, which avoids an allocation in tight loops.
     """
-    jacobian = np.empty((6, model.nv), dtype=data.qpos.dtype)
+    if out is None:
+        jacobian = np.empty((6, model.nv), dtype=data.qpos.dtype)
+    else:
+        jacobian = out
     jacobian_position, jacobian_rotation = jacobian[:3], jacobian[3:]
 
     if object_type == mujoco.mjtObj.mjOBJ_BODY:
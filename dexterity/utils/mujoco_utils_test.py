@@ -0,0 +1,38 @@
+"""Tests for mujoco_utils."""
+
+import numpy as np
+from absl.testing import absltest
+from absl.testing import parameterized
+from dm_control import mjcf
+
+from dexterity.models.hands import adroit_hand
+from dexterity.utils import mujoco_utils
+
+
+class MujocoUtilsTest(parameterized.TestCase):
+    @parameterized.parameters(True, False)
+    def test_get_sites_velocities_matches_get_site_velocity(
+        self, world_frame: bool
+    ) -> None:
+        random_state = np.random.RandomState(12345)
+
+        hand = adroit_hand.AdroitHand()
+        physics = mjcf.Physics.from_mjcf_model(hand.mjcf_model)
+        physics.bind(hand.joints).qpos = hand.sample_joint_angles(physics, random_state)
+        physics.bind(hand.joints).qvel = random_state.randn(hand.num_joints)
+        physics.forward()
+
+        actual = mujoco_utils.get_sites_velocities(
+            physics, hand.fingertip_sites, world_frame=world_frame
+        )
+        expected = np.stack(
+            [
+                mujoco_utils.get_site_velocity(physics, site, world_frame=world_frame)
+                for site in hand.fingertip_sites
+            ]
+        )
+        np.testing.assert_allclose(actual, expected)
+
+
+if __name__ == "__main__":
+    absltest.main()
@@ -59,8 +59,6 @@ def main(_) -> None:
         xyaxes=cameras.FRONT_CLOSE.xyaxes,
     )
 
-    solver = ik_solver.IKSolver(hand=hand)
-
     # Create target sites for each fingertip.
     target_sites = []
     for i, site in enumerate(hand.fingertip_sites):
@@ -82,9 +80,13 @@ def main(_) -> None:
 
     render_kwargs = dict(width=640, height=480, camera_id=0)
 
+    # Compile the scene once and share the compiled model with the solver.
+    physics = mjcf.Physics.from_mjcf_model(arena.mjcf_model)
+    solver = ik_solver.IKSolver(hand=hand, physics=physics)
+
     successes: int = 0
     for _ in range(FLAGS.num_solves):
-        physics = mjcf.Physics.from_mjcf_model(arena.mjcf_model)
+        physics.reset()
 
         # Randomly sample a joint configuration.
         qpos_initial = physics.bind(hand.joints).qpos.copy()